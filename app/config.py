@@ -3,22 +3,41 @@
 
 환경 변수(.env)와 YAML 설정 파일을 로드하여 통합 관리합니다.
 """
+import functools
+import json
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple, Type
 from dotenv import load_dotenv
 import yaml
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+
+# LibYAML C 바인딩이 있으면 CSafeLoader 사용 (없으면 순수 Python SafeLoader로 대체)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 
-# .env 파일 로드 (환경 변수를 먼저 로드해야 ENV를 읽을 수 있음)
 env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
 
 
-class ServerSettings(BaseSettings):
+def _load_env() -> None:
+    """
+    .env 파일 로드 (환경 변수를 먼저 로드해야 ENV를 읽을 수 있음)
+    
+    모듈 import 시점이 아니라 설정을 처음 생성할 때 호출됩니다.
+    이미 로드된 경우(리로드/워커 프로세스 등 환경 변수를 상속받은 경우) 다시 파싱하지 않습니다.
+    """
+    if os.environ.get("_DOTENV_LOADED"):
+        return
+    if env_path.exists():
+        load_dotenv(env_path)
+    os.environ["_DOTENV_LOADED"] = "1"
+
+
+class ServerSettings(BaseModel):
     """서버 관련 설정"""
     host: str = Field(default="127.0.0.1")
     port: int = Field(default=8000)
@@ -29,7 +48,7 @@ class ServerSettings(BaseSettings):
     version: str = "0.0.1"
 
 
-class CORSSettings(BaseSettings):
+class CORSSettings(BaseModel):
     """CORS 관련 설정"""
     allow_origins: List[str] = Field(default=["*"])
     allow_credentials: bool = True
@@ -37,33 +56,115 @@ class CORSSettings(BaseSettings):
     allow_headers: List[str] = ["*"]
 
 
-class LoggingSettings(BaseSettings):
+class LoggingSettings(BaseModel):
     """로깅 관련 설정"""
-    level: str = Field(default="INFO", env="LOG_LEVEL")
+    level: str = Field(default="INFO")  # 환경 변수(LOG_LEVEL)가 있으면 우선
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    file: Optional[str] = Field(default=None, env="LOG_FILE")
+    file: Optional[str] = Field(default=None)  # 환경 변수(LOG_FILE)가 있으면 우선
     max_bytes: int = 10485760  # 10MB
     backup_count: int = 5
 
 
-class DatabaseSettings(BaseSettings):
+class DatabaseSettings(BaseModel):
     """데이터베이스 관련 설정"""
     host: str = Field(default="localhost")  # YAML에서만 가져옴 (env 제거)
     port: int = Field(default=5432)  # YAML에서만 가져옴 (env 제거)
     name: str = Field(default="myapp")  # YAML에서만 가져옴 (env 제거)
     user: str = Field(default="user")  # YAML에서만 가져옴 (env 제거)
-    password: str = Field(default="password", env="DB_PASSWORD")  # 환경 변수에서만 가져옴
-    pool_size: int = 10
+    password: str = Field(default="password")  # 환경 변수(DB_PASSWORD)에서만 가져옴
+    min_pool_size: int = 1
+    pool_size: int = 10  # 워커별 최대 연결 수 (gunicorn 실행 시 max_total_connections // workers 이하로 조정)
     max_overflow: int = 20
+    max_total_connections: int = 90  # 전체 워커의 DB 연결 한도 (PostgreSQL 기본값 100에서 관리용 여유분 제외)
 
 
-class APISettings(BaseSettings):
+class APISettings(BaseModel):
     """API 관련 설정"""
     timeout: int = 30
     retry_count: int = 3
     rate_limit: int = 100
 
 
+class AppSettings(BaseSettings):
+    """
+    환경 변수를 읽는 통합 설정 모델
+    
+    하위 설정은 일반 BaseModel이므로 환경 변수 스키마는 이 클래스 하나만 생성됩니다.
+    중첩 필드는 `APP_DATABASE__PORT` 형식의 환경 변수로 지정할 수 있으며, YAML 값보다 우선합니다.
+    (APP_ 접두사가 없으면 API, SERVER 등 일반적인 이름의 환경 변수를 설정 값으로 파싱하여 기동에 실패함)
+    """
+    model_config = SettingsConfigDict(env_prefix="APP_", env_nested_delimiter="__")
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """ 환경 변수를 생성자 인자(YAML 설정)보다 우선 적용 """
+        return env_settings, init_settings, dotenv_settings, file_secret_settings
+    
+    server: ServerSettings = Field(default_factory=ServerSettings)
+    cors: CORSSettings = Field(default_factory=CORSSettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    api: APISettings = Field(default_factory=APISettings)
+
+
+def _load_yaml_config(config_file: Path) -> dict:
+    """
+    YAML 설정 파일을 읽어 딕셔너리로 반환합니다.
+    
+    파싱 결과는 같은 디렉토리의 JSON 캐시 파일(config.{env}.cache.json)에 저장되며,
+    캐시에 기록된 YAML 파일의 수정 시각(st_mtime_ns)과 크기(st_size)가 현재 파일과
+    정확히 일치할 때만 YAML 대신 캐시를 읽습니다.
+    (수정 시각을 보존하는 배포 방식(rsync -a, cp -p, tar 등)에서도 변경된 YAML이 무시되지 않음)
+    
+    Args:
+        config_file: YAML 설정 파일 경로
+        
+    Returns:
+        dict: 설정 딕셔너리 (파일이 없으면 빈 딕셔너리)
+    """
+    try:
+        yaml_stat = config_file.stat()
+    except OSError:
+        return {}
+    
+    cache_file = config_file.with_suffix(".cache.json")
+    source = {"mtime_ns": yaml_stat.st_mtime_ns, "size": yaml_stat.st_size}
+    
+    # 캐시에 기록된 YAML 파일 정보가 현재 파일과 일치하면 캐시 사용
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("source") == source:
+            return cache["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # 캐시가 없거나 손상된 경우 YAML에서 다시 읽음
+    
+    with open(config_file, 'r', encoding='utf-8') as f:
+        yaml_config = yaml.load(f, Loader=YamlLoader) or {}
+    
+    # 캐시 저장 (임시 파일에 쓴 뒤 rename하여 원자적으로 교체)
+    # 읽기 전용 파일 시스템(컨테이너 이미지 등)에서는 캐시 없이 계속 진행
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"source": source, "config": yaml_config}, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+    
+    return yaml_config
+
+
 class Settings:
     """통합 설정 클래스"""
     
@@ -74,7 +175,7 @@ class Settings:
         환경 변수 ENV에 따라 적절한 설정 파일을 자동으로 선택하여 로드합니다.
         
         동작 과정:
-        1. 환경 변수 ENV 확인 (기본값: local)
+        1. .env 파일 로드 후 환경 변수 ENV 확인 (기본값: local)
         2. resource/conf/config.{ENV}.yaml 파일 경로 설정
         3. YAML 파일 읽기 → Python 딕셔너리로 변환
         4. 딕셔너리 데이터를 각 Settings 클래스에 전달
@@ -84,6 +185,7 @@ class Settings:
             config_file: YAML 설정 파일 경로 (지정하지 않으면 ENV에 따라 자동 선택)
         """
         # 1단계: 환경 변수 ENV 확인 (기본값: local)
+        _load_env()
         env = os.getenv("ENV", "local").lower()
         
         # 2단계: YAML 파일 경로 설정
@@ -104,28 +206,38 @@ class Settings:
         # 3단계: YAML 파일 읽기 및 파싱
         # config.yaml 파일을 읽어서 Python 딕셔너리로 변환합니다
         # 예: {"server": {"host": "127.0.0.1", "port": 8000}, ...}
-        yaml_config = {}
-        if config_file.exists():
-            with open(config_file, 'r', encoding='utf-8') as f:
-                yaml_config = yaml.safe_load(f) or {}
+        # (JSON 캐시가 현재 YAML 파일과 일치하면 캐시에서 읽음)
+        yaml_config = _load_yaml_config(config_file)
         
         # 4단계: 딕셔너리 데이터를 Python 객체로 변환
-        # yaml_config.get("server", {}) → {"host": "127.0.0.1", "port": 8000}
-        # ServerSettings(**{...}) → ServerSettings 객체 생성
-        # 주의: Pydantic BaseSettings는 kwargs가 환경 변수보다 우선하므로,
-        # 환경 변수를 우선시하려면 YAML에서 보안 정보(비밀번호 등)를 제외해야 합니다.
+        # yaml_config → {"server": {"host": "127.0.0.1", "port": 8000}, ...}
+        # AppSettings(**{...}) → 하위 설정(server, database 등)을 한 번에 생성
+        # APP_ 접두사 환경 변수(예: APP_SERVER__PORT)는 YAML 값보다 우선 적용됩니다.
         
         # YAML에서 database 설정 가져오기 (password 제외 - 환경 변수에서만 가져옴)
         db_config = yaml_config.get("database", {}).copy()
         # password는 YAML에서 제거하여 환경 변수(.env)에서만 가져오도록 함
         # 보안상 비밀번호는 반드시 환경 변수로만 관리
         db_config.pop("password", None)
+        db_password_env = os.getenv("DB_PASSWORD")
+        if db_password_env is not None:
+            db_config["password"] = db_password_env
+        
+        # 로그 레벨/파일은 환경 변수(LOG_LEVEL, LOG_FILE)가 있으면 YAML보다 우선
+        logging_config = yaml_config.get("logging", {}).copy()
+        for env_name, key in (("LOG_LEVEL", "level"), ("LOG_FILE", "file")):
+            env_value = os.getenv(env_name)
+            if env_value is not None:
+                logging_config[key] = env_value
         
-        self.server = ServerSettings(**yaml_config.get("server", {}))
-        self.cors = CORSSettings(**yaml_config.get("cors", {}))
-        self.logging = LoggingSettings(**yaml_config.get("logging", {}))
-        self.database = DatabaseSettings(**db_config)  # password 제외된 설정 사용
-        self.api = APISettings(**yaml_config.get("api", {}))
+        app_settings = AppSettings(
+            **{**yaml_config, "database": db_config, "logging": logging_config}
+        )
+        self.server = app_settings.server
+        self.cors = app_settings.cors
+        self.logging = app_settings.logging
+        self.database = app_settings.database
+        self.api = app_settings.api
         
         # CORS allow_origins 문자열 파싱 (환경 변수에서)
         if isinstance(self.cors.allow_origins, str):
@@ -134,20 +246,59 @@ class Settings:
                 for origin in self.cors.allow_origins.split(",")
             ]
     
-    def get_database_url(self) -> str:
-        """데이터베이스 연결 URL 생성"""
+    @functools.cached_property
+    def database_url(self) -> str:
+        """데이터베이스 연결 URL (최초 접근 시 한 번만 생성)"""
         return (
             f"postgresql://{self.database.user}:{self.database.password}"
             f"@{self.database.host}:{self.database.port}/{self.database.name}"
         )
+    
+    @functools.cached_property
+    def asyncpg_connect_kwargs(self) -> dict:
+        """asyncpg.create_pool()에 그대로 전달할 접속 정보 (최초 접근 시 한 번만 생성)"""
+        return {
+            "host": self.database.host,
+            "port": self.database.port,
+            "user": self.database.user,
+            "password": self.database.password,
+            "database": self.database.name,
+        }
+    
+    def get_database_url(self) -> str:
+        """데이터베이스 연결 URL 반환 (하위 호환용)"""
+        return self.database_url
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings(config_file: Optional[str] = None) -> Settings:
+    """
+    설정 인스턴스를 반환합니다.
+    
+    최초 호출 시 한 번만 Settings를 생성하고, 이후에는 캐시된 인스턴스를 반환합니다.
+    
+    Args:
+        config_file: YAML 설정 파일 경로 (지정하지 않으면 ENV에 따라 자동 선택)
+        
+    Returns:
+        Settings: 설정 인스턴스
+    """
+    return Settings(config_file)
 
 
-# 전역 설정 인스턴스
-settings = Settings()
+def __getattr__(name: str):
+    """
+    전역 설정 인스턴스(settings) 지연 생성 (PEP 562)
+    
+    `from app.config import settings` 시점에 처음 생성되므로
+    모듈 import만으로는 설정 파일을 읽지 않습니다.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # 사용 예제:
 # from app.config import settings
 # print(settings.server.host)
 # print(settings.database.host)
-
@@ -1,27 +1,41 @@
+import logging
+
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/v1/simple", tags=["Simple"])
 
 class BasicPayloadIvo(BaseModel):
     """ Post 요청 IVO 모델 """
     name: str = Field(..., description="메시지 기본 전문")
 
-@router.get("/")
+class BasicResponseOvo(BaseModel):
+    """ 기본 응답 OVO 모델 """
+    status: int = Field(..., description="응답 상태 코드")
+    message: str = Field(..., description="응답 메시지")
+
+class PostResponseOvo(BasicResponseOvo):
+    """ Post 응답 OVO 모델 """
+    recv_data: BasicPayloadIvo = Field(..., description="수신한 요청 전문")
+
+# response_model을 지정하면 Pydantic(Rust)이 응답을 JSON 바이트로 바로 직렬화함 (FastAPI 0.131+)
+@router.get("/", response_model=BasicResponseOvo)
 async def handle_get():
-    print("handle get method")
+    logger.debug("handle get method")
     return {
         "status": 200,
         "message": "hello world"
     }
 
-@router.post("/")
+@router.post("/", response_model=PostResponseOvo)
 async def handle_post(payload: BasicPayloadIvo):
-    print(f"handle post method, payload: {payload}")
+    logger.debug("handle post method, payload: %s", payload)
     return {
         "status": 200,
         "message": "hello world",
-        "recv_data": payload.dict()
+        "recv_data": payload
     }
 
 
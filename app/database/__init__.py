@@ -5,6 +5,7 @@ from app.database.connection import (
     get_db_pool,
     close_db_pool,
     init_db_pool,
+    set_db_pool_size,
     get_connection,
 )
 
@@ -12,6 +13,7 @@ __all__ = [
     "get_db_pool",
     "close_db_pool",
     "init_db_pool",
+    "set_db_pool_size",
     "get_connection",
 ]
 
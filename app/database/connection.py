@@ -4,14 +4,35 @@ PostgreSQL 데이터베이스 연결 풀 관리 모듈
 이 모듈은 asyncpg를 사용하여 PostgreSQL 데이터베이스와의 연결을 관리합니다.
 연결 풀을 사용하여 효율적으로 데이터베이스 연결을 재사용합니다.
 """
+import logging
 import asyncpg
 from typing import Optional
-from app.config import settings
+from app.config import get_settings
+
+
+logger = logging.getLogger(__name__)
 
 
 # 전역 연결 풀 변수
 _db_pool: Optional[asyncpg.Pool] = None
 
+# 워커별 연결 풀 최대 크기 (None이면 DatabaseSettings.pool_size 사용)
+_pool_size_override: Optional[int] = None
+
+
+def set_db_pool_size(pool_size: int) -> None:
+    """
+    연결 풀 최대 크기 지정
+    
+    init_db_pool() 호출 전에 사용하며, 설정 파일의 database.pool_size 대신 적용됩니다.
+    gunicorn post_fork 훅에서 워커 수에 맞춘 워커별 풀 크기를 지정할 때 사용합니다.
+    
+    Args:
+        pool_size: 연결 풀 최대 크기
+    """
+    global _pool_size_override
+    _pool_size_override = pool_size
+
 
 async def init_db_pool() -> asyncpg.Pool:
     """
@@ -31,39 +52,43 @@ async def init_db_pool() -> asyncpg.Pool:
     if _db_pool is not None:
         return _db_pool
     
-    try:
-        # 연결 풀 생성
-        # min_size: 최소 연결 수 (기본값: 10)
-        # max_size: 최대 연결 수 (기본값: 10)
-        # max_queries: 연결당 최대 쿼리 수 (기본값: 50000)
-        # max_inactive_connection_lifetime: 비활성 연결 유지 시간 (초)
-        _db_pool = await asyncpg.create_pool(
-            host=settings.database.host,
-            port=settings.database.port,
-            user=settings.database.user,
-            password=settings.database.password,
-            database=settings.database.name,
-            min_size=1,  # 최소 연결 수
-            max_size=settings.database.pool_size,  # 최대 연결 수 (config에서 가져옴)
-            max_queries=50000,  # 연결당 최대 쿼리 수
-            max_inactive_connection_lifetime=300,  # 5분간 비활성 연결 유지
-            command_timeout=60,  # 쿼리 타임아웃 (초)
-        )
-        
-        print(f"✅ PostgreSQL 연결 풀 생성 완료")
-        print(f"   - Host: {settings.database.host}:{settings.database.port}")
-        print(f"   - Database: {settings.database.name}")
-        print(f"   - User: {settings.database.user}")
-        print(f"   - Pool Size: {settings.database.pool_size}")
-        
-        return _db_pool
-        
-    except asyncpg.PostgresError as e:
-        print(f"❌ PostgreSQL 연결 실패: {e}")
-        raise
-    except Exception as e:
-        print(f"❌ 데이터베이스 연결 풀 생성 중 오류 발생: {e}")
-        raise
+    settings = get_settings()
+    pool_size = settings.database.pool_size
+    if _pool_size_override is not None:
+        pool_size = _pool_size_override
+    
+    # 연결 풀 생성 (실패 시 예외는 호출자(lifespan)에서 한 번만 로깅)
+    # min_size: 풀 생성 시 미리 여는 최소 연결 수 (기본값: 10)
+    #           첫 요청이 TCP 연결/인증 비용을 부담하지 않도록 함
+    # max_size: 최대 연결 수 (기본값: 10)
+    # max_queries: 연결당 최대 쿼리 수 (기본값: 50000)
+    # max_inactive_connection_lifetime: 비활성 연결 유지 시간 (초)
+    # statement_cache_size: 연결당 prepared statement 캐시 크기 (기본값: 100)
+    # max_cached_statement_lifetime: 캐시된 statement 유지 시간 (0 = 만료 없음)
+    # server_settings: 세션 파라미터 (짧은 OLTP 쿼리에는 JIT 컴파일 비용이 더 큼)
+    _db_pool = await asyncpg.create_pool(
+        **settings.asyncpg_connect_kwargs,  # host, port, user, password, database
+        min_size=min(settings.database.min_pool_size, pool_size),  # 최소 연결 수
+        max_size=pool_size,  # 최대 연결 수 (config 또는 set_db_pool_size()에서 가져옴)
+        max_queries=50000,  # 연결당 최대 쿼리 수
+        max_inactive_connection_lifetime=300,  # 5분간 비활성 연결 유지
+        command_timeout=60,  # 쿼리 타임아웃 (초)
+        statement_cache_size=1024,  # prepared statement 캐시 크기
+        max_cached_statement_lifetime=0,  # 캐시된 statement 만료 없음
+        server_settings={"jit": "off"},  # 쿼리별 JIT 컴파일 비활성화
+    )
+    
+    logger.debug(
+        "PostgreSQL 연결 풀 생성 완료 (host=%s:%s, database=%s, user=%s, min_pool_size=%d, pool_size=%d)",
+        settings.database.host,
+        settings.database.port,
+        settings.database.name,
+        settings.database.user,
+        settings.database.min_pool_size,
+        pool_size,
+    )
+    
+    return _db_pool
 
 
 async def close_db_pool() -> None:
@@ -77,7 +102,7 @@ async def close_db_pool() -> None:
     if _db_pool is not None:
         await _db_pool.close()
         _db_pool = None
-        print("✅ PostgreSQL 연결 풀 종료 완료")
+        logger.debug("PostgreSQL 연결 풀 종료 완료")
 
 
 def get_db_pool() -> Optional[asyncpg.Pool]:
@@ -137,11 +162,11 @@ async def execute_query(query: str, *args) -> list:
     if pool is None:
         raise RuntimeError("데이터베이스 연결 풀이 초기화되지 않았습니다.")
     
-    async with pool.acquire() as conn:
-        return await conn.fetch(query, *args)
+    # pool.fetch()가 연결 획득/반환을 내부에서 처리
+    return await pool.fetch(query, *args)
 
 
-async def execute_insert(query: str, *args) -> str:
+async def execute_insert(query: str, *args) -> Optional[str]:
     """
     INSERT 쿼리를 실행하고 삽입된 행의 ID를 반환합니다.
     
@@ -150,7 +175,7 @@ async def execute_insert(query: str, *args) -> str:
         *args: 쿼리 파라미터
         
     Returns:
-        str: 삽입된 행의 ID (RETURNING 절이 있는 경우)
+        Optional[str]: 삽입된 행의 ID (RETURNING 절이 없으면 None)
         
     Example:
         user_id = await execute_insert(
@@ -163,10 +188,6 @@ async def execute_insert(query: str, *args) -> str:
     if pool is None:
         raise RuntimeError("데이터베이스 연결 풀이 초기화되지 않았습니다.")
     
-    async with pool.acquire() as conn:
-        result = await conn.fetchrow(query, *args)
-        if result:
-            # RETURNING 절이 있는 경우 첫 번째 컬럼 반환
-            return result[0] if len(result) > 0 else None
-        return None
+    # RETURNING 절이 있는 경우 첫 번째 행의 첫 번째 컬럼 반환 (결과가 없으면 None)
+    return await pool.fetchval(query, *args)
 
@@ -0,0 +1,80 @@
+"""
+Gunicorn 서버 훅 모듈
+
+gunicorn 설정 파일에서 다음과 같이 사용합니다:
+    from app.gunicorn_hooks import nworkers_changed, on_starting, post_fork, worker_exit
+    logger_class = "app.gunicorn_logging.QueueLogger"
+
+DB 연결 수 불변 조건: workers * 워커별 pool_size <= database.max_total_connections
+워커 수는 설정 파일 값이 아니라 실제 적용된 값(-w, WEB_CONCURRENCY, GUNICORN_CMD_ARGS, TTIN 반영)을 사용하며,
+한도보다 많으면 max_total_connections개로 제한합니다.
+UvicornWorker는 비동기 워커이므로 threads가 아니라 연결 풀 크기가 워커당 DB 동시성을 결정합니다.
+"""
+from app.config import get_settings
+from app.database.connection import set_db_pool_size
+from app.gunicorn_logging import QueueLogger
+
+
+def _worker_pool_size(num_workers: int, pool_size: int, max_total_connections: int) -> int:
+    """
+    워커별 DB 연결 풀 크기 계산 (설정 파일의 pool_size를 넘지 않음)
+
+    Args:
+        num_workers: 실제 워커 수
+        pool_size: 설정 파일의 워커별 최대 연결 수 (database.pool_size)
+        max_total_connections: 전체 워커의 DB 연결 한도 (database.max_total_connections)
+
+    Returns:
+        int: 워커별 연결 풀 크기
+
+    Raises:
+        ValueError: 워커 수가 전체 DB 연결 한도보다 많은 경우
+    """
+    if num_workers > max_total_connections:
+        raise ValueError(
+            f"워커 수({num_workers})가 전체 DB 연결 한도"
+            f"(database.max_total_connections={max_total_connections})보다 많습니다."
+        )
+    return min(pool_size, max_total_connections // num_workers)
+
+
+def nworkers_changed(server, new_value, old_value):
+    """ 워커 수가 전체 DB 연결 한도를 넘으면 한도만큼으로 제한 """
+    max_total_connections = get_settings().database.max_total_connections
+    if new_value > max_total_connections:
+        server.log.warning(
+            "워커 수(%d)가 전체 DB 연결 한도(database.max_total_connections=%d)보다 많아 %d개로 제한합니다.",
+            new_value,
+            max_total_connections,
+            max_total_connections,
+        )
+        server.num_workers = max_total_connections
+
+
+def on_starting(server):
+    """ 마스터 시작 시 워커별 DB 연결 풀 크기 로깅 """
+    database = get_settings().database
+    server.log.info(
+        "DB 연결 풀 크기: 워커 %d개 x %d (max_total_connections=%d)",
+        server.num_workers,
+        _worker_pool_size(server.num_workers, database.pool_size, database.max_total_connections),
+        database.max_total_connections,
+    )
+
+
+def post_fork(server, worker):
+    """ 워커 fork 직후 연결 풀 크기 지정 및 로거를 큐 기반으로 전환 """
+    # 연결 풀은 워커의 lifespan에서 생성되므로 그 전에 풀 크기를 지정
+    database = get_settings().database
+    set_db_pool_size(
+        _worker_pool_size(server.num_workers, database.pool_size, database.max_total_connections)
+    )
+
+    if isinstance(worker.log, QueueLogger):
+        worker.log.start_queue()
+
+
+def worker_exit(server, worker):
+    """ 워커 종료 시 큐에 남은 로그를 모두 기록하고 리스너 스레드 정리 """
+    if isinstance(worker.log, QueueLogger):
+        worker.log.stop_queue()
@@ -0,0 +1,63 @@
+"""
+Gunicorn 비동기 로깅 모듈 (큐 기반)
+
+워커의 로그 파일 쓰기를 백그라운드 스레드(QueueListener)로 옮겨
+요청 처리 중(이벤트 루프 스레드)에는 큐에 적재만 하도록 합니다.
+
+gunicorn 설정 파일의 logger_class로 지정하며,
+큐 전환/정리는 app/gunicorn_hooks.py의 post_fork / worker_exit 훅에서 호출합니다.
+"""
+import logging
+import logging.handlers
+import queue
+from typing import List
+
+from gunicorn.glogging import Logger
+
+
+class QueueLogger(Logger):
+    """
+    gunicorn.error / gunicorn.access 로그를 큐를 통해 기록하는 gunicorn Logger
+
+    파일 핸들러는 로거에서 분리되어 QueueListener가 소유하므로,
+    USR1 시그널(logrotate) 시 리스너의 핸들러도 함께 다시 엽니다.
+    """
+
+    log_listeners: List[logging.handlers.QueueListener] = []
+
+    def start_queue(self) -> None:
+        """ 로거의 핸들러를 QueueListener로 옮기고 QueueHandler로 교체 """
+        self.log_listeners = []
+        for log in (self.error_log, self.access_log):
+            if not log.handlers:
+                continue
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(
+                log_queue, *log.handlers, respect_handler_level=True
+            )
+            # UvicornWorker의 uvicorn.error / uvicorn.access 로거가 같은 핸들러 리스트를 공유하므로
+            # 리스트를 직접 교체해야 uvicorn 로그에도 적용됨
+            log.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+            listener.start()
+            self.log_listeners.append(listener)
+
+    def stop_queue(self) -> None:
+        """ 큐에 남은 로그를 모두 기록하고 리스너 스레드 정리 """
+        for listener in self.log_listeners:
+            listener.stop()
+        self.log_listeners = []
+
+    def reopen_files(self) -> None:
+        super().reopen_files()
+
+        for listener in self.log_listeners:
+            for handler in listener.handlers:
+                if isinstance(handler, logging.FileHandler):
+                    handler.acquire()
+                    try:
+                        if handler.stream:
+                            handler.close()
+                            handler.stream = handler._open()
+                    finally:
+                        handler.release()
+
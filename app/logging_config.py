@@ -0,0 +1,66 @@
+"""
+로깅 설정 모듈
+
+로그 레코드는 QueueHandler를 통해 큐에 적재만 하고,
+실제 출력(StreamHandler write)은 QueueListener의 백그라운드 스레드가 담당합니다.
+이벤트 루프 스레드에서 stdout 쓰기로 인한 블로킹이 발생하지 않습니다.
+"""
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+from app.config import get_settings
+
+
+# 전역 로그 큐 / 리스너 변수
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def init_logging() -> None:
+    """
+    로깅 초기화
+
+    애플리케이션 시작 시 한 번 호출하여 루트 로거에 QueueHandler를 연결하고
+    백그라운드 QueueListener 스레드를 시작합니다.
+    config.py의 LoggingSettings에서 레벨과 포맷을 가져옵니다.
+    """
+    global _queue_handler, _log_listener
+
+    if _log_listener is not None:
+        return
+
+    settings = get_settings()
+
+    # 실제 출력 핸들러 (백그라운드 스레드에서 실행)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(settings.logging.format))
+
+    # 루트 로거에는 큐에 적재만 하는 QueueHandler 연결
+    _queue_handler = logging.handlers.QueueHandler(_log_queue)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(settings.logging.level)
+    root_logger.addHandler(_queue_handler)
+
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, stream_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+def close_logging() -> None:
+    """
+    로깅 종료
+
+    애플리케이션 종료 시 호출하여 큐에 남은 로그를 모두 출력한 뒤 리스너 스레드를 정리합니다.
+    """
+    global _queue_handler, _log_listener
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
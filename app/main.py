@@ -1,15 +1,51 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.controller.sample_controller import sample_router
 from app.config import settings
 from app.database.connection import init_db_pool, close_db_pool
+from app.logging_config import init_logging, close_logging
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """ 서버 시작/종료 시 실행되는 lifespan 핸들러 """
+    # 로깅 초기화 (로그 출력은 백그라운드 스레드에서 처리)
+    init_logging()
+    logger.info("Start Web Server")
+    logger.debug("config: %s", settings)
+    
+    # 데이터베이스 연결 풀 초기화 (min_pool_size만큼 미리 연결)
+    try:
+        await init_db_pool()
+    except Exception as e:
+        logger.warning(
+            "데이터베이스 연결 실패: %s - 서버는 계속 실행되지만 데이터베이스 기능은 사용할 수 없습니다.",
+            e,
+        )
+    
+    yield
+    
+    logger.info("Shutting down Web Server")
+    
+    # 데이터베이스 연결 풀 종료
+    await close_db_pool()
+    
+    # 로깅 종료 (큐에 남은 로그 출력 후 리스너 정리)
+    close_logging()
 
 
 app = FastAPI(
     title=settings.server.title,
     description=settings.server.description,
     version=settings.server.version,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -23,29 +59,6 @@ app.add_middleware(
 # add router
 app.include_router(sample_router)
 
-@app.on_event("startup")
-async def startup_event():
-    """ 서버 시작 시 실행되는 이벤트 """
-    print(" 🚀 Start Web Server")
-    print(f"config: {settings}")
-    
-    # 데이터베이스 연결 풀 초기화
-    try:
-        await init_db_pool()
-    except Exception as e:
-        print(f"⚠️  데이터베이스 연결 실패: {e}")
-        print("   서버는 계속 실행되지만 데이터베이스 기능은 사용할 수 없습니다.")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """ 서버 종료 시 실행되는 이벤트 """
-    print(" 🛑 Shutting down Web Server")
-    
-    # 데이터베이스 연결 풀 종료
-    await close_db_pool()
-
-
 
 if __name__ == '__main__':
     import uvicorn
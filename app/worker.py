@@ -0,0 +1,14 @@
+"""
+Gunicorn 워커 클래스 모듈
+
+UvicornWorker의 기본값(loop="auto", http="auto")은 uvloop/httptools가 설치되어 있지 않으면
+조용히 asyncio/h11(순수 Python)로 대체됩니다.
+이 모듈의 워커는 C 구현(uvloop 이벤트 루프, httptools HTTP 파서)을 명시적으로 사용하며,
+패키지가 없으면 워커 시작 시 바로 실패하여 성능 저하를 놓치지 않도록 합니다.
+"""
+from uvicorn.workers import UvicornWorker
+
+
+class FastUvicornWorker(UvicornWorker):
+    """ uvloop + httptools를 사용하는 UvicornWorker """
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "loop": "uvloop", "http": "httptools"}
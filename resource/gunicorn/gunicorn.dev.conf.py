@@ -4,17 +4,20 @@ Gunicorn 설정 파일 - Development 환경
 """
 import multiprocessing
 
+from app.gunicorn_hooks import nworkers_changed, on_starting, post_fork, worker_exit  # noqa: F401 (gunicorn 서버 훅)
+
 # 바인딩 주소 및 포트
 bind = "0.0.0.0:8000"
 
 # 워커 설정
 workers = multiprocessing.cpu_count() * 2 + 1  # CPU 코어 수 기반
-worker_class = "uvicorn.workers.UvicornWorker"
+worker_class = "app.worker.FastUvicornWorker"  # uvloop + httptools (app/worker.py)
 worker_connections = 1000
 
 # 리로드 설정
 reload = False  # Dev 서버에서는 리로드 비활성화 (안정성)
 reload_engine = "auto"
+preload_app = True  # 애플리케이션 사전 로드 (메모리 공유, DB 연결 풀은 워커별 lifespan에서 생성)
 
 # 타임아웃 설정
 timeout = 120
@@ -24,6 +27,8 @@ graceful_timeout = 30
 # 로깅 설정
 accesslog = "logs/gunicorn.dev.access.log"
 errorlog = "logs/gunicorn.dev.error.log"
+# 비동기 로깅: 워커의 로그 파일 쓰기를 백그라운드 스레드로 처리 (app/gunicorn_logging.py)
+logger_class = "app.gunicorn_logging.QueueLogger"
 loglevel = "info"
 
 # 프로세스 이름
@@ -40,4 +45,3 @@ tmp_upload_dir = None
 # 성능 최적화
 max_requests = 1000
 max_requests_jitter = 50
-
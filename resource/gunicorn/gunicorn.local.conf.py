@@ -11,7 +11,7 @@ bind = "0.0.0.0:8000"
 
 # 워커 설정
 workers = 1  # Local에서는 단일 워커
-worker_class = "uvicorn.workers.UvicornWorker"
+worker_class = "app.worker.FastUvicornWorker"  # uvloop + httptools (app/worker.py)
 worker_connections = 1000
 
 # 리로드 설정 (개발용)
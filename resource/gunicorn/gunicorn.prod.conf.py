@@ -3,29 +3,41 @@ Gunicorn 설정 파일 - Production 환경
 프로덕션 서버용 설정 (최적화)
 """
 import multiprocessing
-import os
+
+from app.gunicorn_hooks import nworkers_changed, on_starting, post_fork, worker_exit  # noqa: F401 (gunicorn 서버 훅)
 
 # 바인딩 주소 및 포트
 bind = "0.0.0.0:8000"
 
 # 워커 설정
 workers = multiprocessing.cpu_count() * 2 + 1  # CPU 코어 수 기반
-worker_class = "uvicorn.workers.UvicornWorker"
+worker_class = "app.worker.FastUvicornWorker"  # uvloop + httptools (app/worker.py)
 worker_connections = 1000
 threads = 2  # 워커당 스레드 수
 
+# DB 연결 풀 크기 (워커별)
+# 불변 조건: workers * database.pool_size <= database.max_total_connections (YAML)
+# 워커별 풀 크기는 실제 워커 수 기준으로 post_fork 훅에서 조정되며,
+# 워커 수가 한도를 넘으면 nworkers_changed 훅에서 한도만큼으로 제한합니다 (app/gunicorn_hooks.py).
+
 # 리로드 설정 (프로덕션에서는 비활성화)
 reload = False
 preload_app = True  # 애플리케이션 사전 로드 (메모리 공유)
 
 # 타임아웃 설정
 timeout = 120
-keepalive = 5
+# keepalive: 유휴 keep-alive 연결 유지 시간 (초)
+#   - 직접 클라이언트를 받는 경우: 짧게(2초) 유지하여 유휴 소켓이 워커를 점유하지 않도록 함
+#   - L7 로드밸런서 뒤에 있는 경우: LB의 idle timeout보다 길게(예: 65초) 설정해야
+#     LB가 끊긴 연결을 재사용하는 502 오류와 요청마다의 TCP 핸드셰이크를 피할 수 있음
+keepalive = 2
 graceful_timeout = 30
 
 # 로깅 설정
 accesslog = "logs/gunicorn.prod.access.log"
 errorlog = "logs/gunicorn.prod.error.log"
+# 비동기 로깅: 워커의 로그 파일 쓰기를 백그라운드 스레드로 처리 (app/gunicorn_logging.py)
+logger_class = "app.gunicorn_logging.QueueLogger"
 loglevel = "warning"  # 프로덕션에서는 warning 이상만 로깅
 
 # 프로세스 이름
@@ -40,11 +52,12 @@ group = None
 tmp_upload_dir = None
 
 # 성능 최적화
-max_requests = 1000
-max_requests_jitter = 50
+# Uvicorn(비동기) 워커는 sync 워커처럼 메모리가 누수되지 않으므로 재시작 주기를 길게 설정
+# (워커 재시작 시 앱 로드, DB 연결 풀 재생성 비용 발생)
+max_requests = 10000
+max_requests_jitter = 500  # 워커들이 동시에 재시작되지 않도록 분산
 
 # 보안 설정
 limit_request_line = 4094
 limit_request_fields = 100
 limit_request_field_size = 8190
-
@@ -0,0 +1,105 @@
+"""
+app.config YAML 캐시 테스트
+"""
+import json
+import os
+
+import pytest
+
+from app import config
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.test.yaml"
+    _write(path, "server:\n  port: 8000\n", 1_700_000_000_000_000_000)
+    return path
+
+
+def test_cache_is_written_and_reused(config_file, monkeypatch):
+    assert config._load_yaml_config(config_file) == {"server": {"port": 8000}}
+
+    cache_file = config_file.with_suffix(".cache.json")
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cache["config"] == {"server": {"port": 8000}}
+
+    # 캐시가 유효하면 YAML을 다시 파싱하지 않음
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML should not be parsed")
+
+    monkeypatch.setattr(config.yaml, "load", fail)
+    assert config._load_yaml_config(config_file) == {"server": {"port": 8000}}
+
+
+def test_cache_invalidated_when_size_changes_with_older_mtime(config_file):
+    config._load_yaml_config(config_file)
+
+    # 수정 시각을 보존(더 과거로 설정)하는 배포에서도 변경 사항이 반영되어야 함
+    _write(config_file, "server:\n  port: 18000\n", 1_600_000_000_000_000_000)
+
+    assert config._load_yaml_config(config_file) == {"server": {"port": 18000}}
+
+
+def test_cache_invalidated_when_mtime_changes_with_same_size(config_file):
+    config._load_yaml_config(config_file)
+
+    _write(config_file, "server:\n  port: 9000\n", 1_700_000_000_000_000_001)
+
+    assert config._load_yaml_config(config_file) == {"server": {"port": 9000}}
+
+
+def test_read_only_cache_directory_falls_back_to_yaml(config_file, monkeypatch):
+    def deny(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(config.os, "replace", deny)
+
+    assert config._load_yaml_config(config_file) == {"server": {"port": 8000}}
+    assert not config_file.with_suffix(".cache.json").exists()
+    assert list(config_file.parent.glob("*.tmp")) == []
+
+
+def test_missing_file_returns_empty_dict(tmp_path):
+    assert config._load_yaml_config(tmp_path / "missing.yaml") == {}
+
+
+def test_env_overrides_yaml_values(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.test.yaml"
+    config_file.write_text(
+        "server:\n  port: 8000\n"
+        "database:\n  port: 5432\n  pool_size: 5\n"
+        "logging:\n  level: WARNING\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("APP_SERVER__PORT", "9999")
+    monkeypatch.setenv("APP_DATABASE__PORT", "6543")
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("LOG_FILE", "logs/test.log")
+
+    settings = config.Settings(str(config_file))
+
+    assert settings.server.port == 9999
+    assert settings.database.port == 6543
+    assert settings.database.pool_size == 5  # 환경 변수가 없는 값은 YAML 유지
+    assert settings.logging.level == "DEBUG"
+    assert settings.logging.file == "logs/test.log"
+
+
+def test_yaml_values_used_without_env(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.test.yaml"
+    config_file.write_text(
+        "server:\n  port: 8000\nlogging:\n  level: WARNING\n", encoding="utf-8"
+    )
+    for name in ("APP_SERVER__PORT", "LOG_LEVEL", "LOG_FILE"):
+        monkeypatch.delenv(name, raising=False)
+
+    settings = config.Settings(str(config_file))
+
+    assert settings.server.port == 8000
+    assert settings.logging.level == "WARNING"
+    assert settings.logging.file is None
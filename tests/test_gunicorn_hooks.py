@@ -0,0 +1,41 @@
+"""
+app.gunicorn_hooks DB 연결 풀 크기 계산 테스트
+"""
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from app import gunicorn_hooks
+from app.config import get_settings
+
+
+def test_worker_pool_size_splits_budget_across_workers():
+    assert gunicorn_hooks._worker_pool_size(7, 20, 90) == 12
+    assert gunicorn_hooks._worker_pool_size(90, 20, 90) == 1
+
+
+def test_worker_pool_size_is_capped_by_pool_size():
+    assert gunicorn_hooks._worker_pool_size(2, 20, 90) == 20
+
+
+def test_worker_pool_size_rejects_workers_over_budget():
+    with pytest.raises(ValueError):
+        gunicorn_hooks._worker_pool_size(91, 20, 90)
+
+
+def test_nworkers_changed_clamps_workers_to_budget():
+    budget = get_settings().database.max_total_connections
+    server = SimpleNamespace(log=logging.getLogger("test"), num_workers=budget + 1)
+
+    gunicorn_hooks.nworkers_changed(server, budget + 1, None)
+
+    assert server.num_workers == budget
+
+
+def test_nworkers_changed_keeps_workers_within_budget():
+    server = SimpleNamespace(log=logging.getLogger("test"), num_workers=3)
+
+    gunicorn_hooks.nworkers_changed(server, 3, None)
+
+    assert server.num_workers == 3